@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import re
-import json
 import os
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+import ahocorasick
+import orjson
 
 # Expected contacts from benchmark
 BENCHMARK_CONTACTS = {
@@ -13,47 +16,134 @@ BENCHMARK_CONTACTS = {
     "Bo Harris": "General Manager"
 }
 
+# First/last name indices over the benchmark, keeping the earliest entry
+# for a shared name so lookups agree with a scan in benchmark order
+_BENCH_ORDER = {name: i for i, name in enumerate(BENCHMARK_CONTACTS)}
+_BENCH_BY_FIRST = {}
+_BENCH_BY_LAST = {}
+for _bench_name in BENCHMARK_CONTACTS:
+    _BENCH_BY_FIRST.setdefault(_bench_name.split()[0], _bench_name)
+    _BENCH_BY_LAST.setdefault(_bench_name.split()[-1], _bench_name)
+
+# Automaton for finding every benchmark name in a single pass over a file
+_BENCH_AUTOMATON = ahocorasick.Automaton()
+for _bench_name in BENCHMARK_CONTACTS:
+    _BENCH_AUTOMATON.add_word(_bench_name, _bench_name)
+_BENCH_AUTOMATON.make_automaton()
+
+# Phrases that mark a match as the business rather than a person
+_EXCLUDED_PHRASES = frozenset({"Dead Horse"})
+
+# Shared fragment matching a two or three word capitalised name
+_NAME = r'[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?'
+
+# Claude typically has structured output
+# Extract: "1. Trey Parker - Current Vice President"
+_CLAUDE_PAT1 = re.compile(rf'(?:^\d+\.\s+)?({_NAME})\s*[-–]\s*(?:Current\s+)?([^(\n]+)', re.MULTILINE)
+# Also try: "- Name: Trey Parker"
+_CLAUDE_PAT2 = re.compile(rf'(?:-\s+)?Name:\s+({_NAME})')
+# Every position a "Name:" entry's title could start at; the lookahead keeps
+# overlapping candidates so the first one after a name is always present.
+_TITLE = re.compile(r'(?=Title:\s+([^\n]+))')
+
+# Compiled extraction patterns for each model family, each paired with the
+# literals it needs (any one of them) so files without them skip the pass.
+# Each pattern is run as its own pass on purpose: fusing them into one
+# alternation only reports non-overlapping matches and drops contacts
+# (e.g. qwen3 and gemini_flash lose names that overlap an earlier match).
+_MODEL_PATTERNS = {
+    "claude": (
+        (("-", "–"), _CLAUDE_PAT1),
+        (("Name:",), _CLAUDE_PAT2),
+    ),
+    # These models might have different formats
+    "deepseek": (
+        (("Name:",), re.compile(rf'(?:Contact\s+)?Name:\s*({_NAME})', re.MULTILINE)),
+        ((",", ":", "-"), re.compile(rf'(?:^\d+\.\s+)?({_NAME})\s*(?:,|:|-)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.MULTILINE)),
+        (("Manager:", "Superintendent:", "Professional:", "President:", "Director:"),
+         re.compile(rf'(?:Manager|Superintendent|Professional|President|Director):\s*({_NAME})', re.MULTILINE)),
+    ),
+    # Google models might format differently
+    "gemini": (
+        (("Contact:", "Name:", "Person:"), re.compile(rf'(?:Contact|Name|Person):\s*({_NAME})', re.MULTILINE)),
+        (("-",), re.compile(rf'({_NAME})\s*-\s*([A-Z][a-z]+ ?[A-Z]?[a-z]*(?:\s+[A-Z][a-z]+)*)', re.MULTILINE)),
+        (("•",), re.compile(rf'•\s*({_NAME})\s*(?:\(|,|-)\s*([^)\n]+)', re.MULTILINE)),
+    ),
+}
+
+# Which pattern family to use for each model's output
+_MODEL_FAMILIES = {
+    "claude_sonnet_4": "claude",
+    "deepseek_r1": "deepseek",
+    "kimi_k2": "deepseek",
+    "qwen3": "deepseek",
+    "gemini_flash": "gemini",
+    "gemini_pro": "gemini",
+    "glm_4_5": "gemini",
+}
+
+def _is_excluded(name):
+    """Check whether a matched name contains an excluded phrase."""
+    return any(phrase in name for phrase in _EXCLUDED_PHRASES)
+
+def _match_benchmark(name):
+    """Find the benchmark contact sharing a first or last name, if any."""
+    parts = name.split()
+    candidates = [
+        match for match in (_BENCH_BY_LAST.get(parts[-1]), _BENCH_BY_FIRST.get(parts[0]))
+        if match is not None
+    ]
+    return min(candidates, key=_BENCH_ORDER.__getitem__) if candidates else None
+
+def _findall(literals, pattern, content):
+    """Run a pattern over the content unless none of its literals appear."""
+    if not any(literal in content for literal in literals):
+        return []
+    return pattern.findall(content)
+
 def extract_contacts_manually(filepath, model_name):
     """Manually extract contacts from each model output."""
+    # Read the whole file: names and titles may wrap across lines and the
+    # Title/benchmark lookups need the full text, so per-line matching
+    # would change the extracted contacts.
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
     contacts = []
+    seen = set()
+    family = _MODEL_FAMILIES.get(model_name)
     
     # Model-specific extraction patterns
-    if model_name == "claude_sonnet_4":
-        # Claude typically has structured output
-        # Extract: "1. Trey Parker - Current Vice President"
-        pattern1 = r'(?:^\d+\.\s+)?([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*[-–]\s*(?:Current\s+)?([^(\n]+)'
-        matches = re.findall(pattern1, content, re.MULTILINE)
+    if family == "claude":
+        pass1, pass2 = _MODEL_PATTERNS[family]
+        matches = _findall(*pass1, content)
+        matches2 = _findall(*pass2, content)
         
-        # Also try: "- Name: Trey Parker"
-        pattern2 = r'(?:-\s+)?Name:\s+([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
-        matches2 = re.findall(pattern2, content)
+        # Index titles once so each name's lookup is a bisect, not a rescan
+        title_starts = []
+        titles = []
+        if matches2:
+            for m in _TITLE.finditer(content):
+                title_starts.append(m.start())
+                titles.append(m.group(1).strip())
         
         # Combine results
         for name, title in matches:
-            if name and "Dead Horse" not in name:
+            if name and not _is_excluded(name) and name not in seen:
+                seen.add(name)
                 contacts.append({"name": name.strip(), "title": title.strip()})
         
         for name in matches2:
-            if name and "Dead Horse" not in name and not any(c['name'] == name for c in contacts):
-                # Find associated title
-                title_match = re.search(rf'{re.escape(name)}.*?Title:\s+([^\n]+)', content, re.DOTALL)
-                if title_match:
-                    contacts.append({"name": name, "title": title_match.group(1).strip()})
+            if name and not _is_excluded(name) and name not in seen:
+                # Find associated title after the first mention of the name
+                i = bisect_left(title_starts, content.find(name) + len(name))
+                if i < len(titles):
+                    seen.add(name)
+                    contacts.append({"name": name, "title": titles[i]})
     
-    elif model_name in ["deepseek_r1", "kimi_k2", "qwen3"]:
-        # These models might have different formats
-        # Try multiple patterns
-        patterns = [
-            r'(?:Contact\s+)?Name:\s*([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
-            r'(?:^\d+\.\s+)?([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*(?:,|:|-)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'(?:Manager|Superintendent|Professional|President|Director):\s*([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
+    elif family is not None:
+        for literals, pattern in _MODEL_PATTERNS[family]:
+            matches = _findall(literals, pattern, content)
             for match in matches:
                 if isinstance(match, tuple):
                     name = match[0]
@@ -62,85 +152,60 @@ def extract_contacts_manually(filepath, model_name):
                     name = match
                     title = "Unknown"
                 
-                if name and "Dead Horse" not in name and not any(c['name'] == name for c in contacts):
-                    contacts.append({"name": name.strip(), "title": title.strip()})
-    
-    elif model_name in ["gemini_flash", "gemini_pro", "glm_4_5"]:
-        # Google models might format differently
-        # Look for contact-like patterns
-        patterns = [
-            r'(?:Contact|Name|Person):\s*([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
-            r'([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*-\s*([A-Z][a-z]+ ?[A-Z]?[a-z]*(?:\s+[A-Z][a-z]+)*)',
-            r'•\s*([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*(?:\(|,|-)\s*([^)\n]+)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    name = match[0]
-                    title = match[1] if len(match) > 1 else "Unknown"
-                else:
-                    name = match
-                    title = "Unknown"
-                
-                if name and "Dead Horse" not in name and not any(c['name'] == name for c in contacts):
+                if name and not _is_excluded(name) and name not in seen:
+                    seen.add(name)
                     contacts.append({"name": name.strip(), "title": title.strip()})
     
     # Also check for any benchmark names mentioned
+    mentioned = {name for _end, name in _BENCH_AUTOMATON.iter(content)}
     for benchmark_name, benchmark_title in BENCHMARK_CONTACTS.items():
-        if benchmark_name in content and not any(c['name'] == benchmark_name for c in contacts):
+        if benchmark_name in mentioned and benchmark_name not in seen:
+            seen.add(benchmark_name)
             contacts.append({"name": benchmark_name, "title": benchmark_title})
     
-    # Remove duplicates and clean up
-    unique_contacts = []
-    seen_names = set()
-    for contact in contacts:
-        if contact['name'] not in seen_names:
-            seen_names.add(contact['name'])
-            unique_contacts.append(contact)
-    
-    return unique_contacts
+    return contacts
 
 def analyze_all_models():
     """Analyze all model outputs and compare to benchmark."""
     output_dir = "model_outputs"
     results = {}
     
-    # Process each model
-    for filename in os.listdir(output_dir):
-        if filename.endswith('_output.txt'):
-            model_name = filename.replace('_output.txt', '')
-            filepath = os.path.join(output_dir, filename)
-            
+    # Extract contacts from each model output in parallel
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith('_output.txt'):
+                    continue
+                model_name = entry.name[:-len('_output.txt')]
+                futures[model_name] = executor.submit(extract_contacts_manually, entry.path, model_name)
+        
+        # Consume in listing order so the results file stays stable
+        for model_name, future in futures.items():
             print(f"\n=== {model_name.upper()} ===")
-            contacts = extract_contacts_manually(filepath, model_name)
+            contacts = future.result()
             
             # Check against benchmark
             found_benchmark = []
-            missed_benchmark = []
+            found_set = set()
             extra_contacts = []
             
             for contact in contacts:
                 if contact['name'] in BENCHMARK_CONTACTS:
                     found_benchmark.append(contact['name'])
+                    found_set.add(contact['name'])
                 else:
                     # Check for variations (e.g., "Trey Parker" might be "Travis Parker")
-                    found_match = False
-                    for bench_name in BENCHMARK_CONTACTS:
-                        if (contact['name'].split()[-1] == bench_name.split()[-1] or 
-                            contact['name'].split()[0] == bench_name.split()[0]):
-                            found_benchmark.append(bench_name)
-                            found_match = True
-                            break
-                    if not found_match:
+                    bench_name = _match_benchmark(contact['name'])
+                    if bench_name:
+                        found_benchmark.append(bench_name)
+                        found_set.add(bench_name)
+                    else:
                         extra_contacts.append(contact)
             
-            for bench_name in BENCHMARK_CONTACTS:
-                if bench_name not in found_benchmark:
-                    missed_benchmark.append(bench_name)
+            missed_benchmark = [name for name in BENCHMARK_CONTACTS if name not in found_set]
             
-            results[model_name] = {
+            model_result = {
                 "contacts_found": len(contacts),
                 "contacts": contacts,
                 "benchmark_matches": found_benchmark,
@@ -148,6 +213,7 @@ def analyze_all_models():
                 "extra_contacts": extra_contacts,
                 "accuracy": len(found_benchmark) / len(BENCHMARK_CONTACTS) if BENCHMARK_CONTACTS else 0
             }
+            results[model_name] = model_result
             
             print(f"Found {len(contacts)} contacts:")
             for contact in contacts:
@@ -157,8 +223,8 @@ def analyze_all_models():
                 print(f"Missed: {', '.join(missed_benchmark)}")
     
     # Save results
-    with open(os.path.join(output_dir, "analysis_results.json"), 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(os.path.join(output_dir, "analysis_results.json"), 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     
     return results
 
@@ -197,5 +263,5 @@ if __name__ == "__main__":
     rankings = rank_models(results)
     
     # Save rankings
-    with open("model_outputs/model_rankings.json", 'w') as f:
-        json.dump(rankings, f, indent=2)
\ No newline at end of file
+    with open("model_outputs/model_rankings.json", 'wb') as f:
+        f.write(orjson.dumps(rankings, option=orjson.OPT_INDENT_2))
\ No newline at end of file
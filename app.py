@@ -6,8 +6,11 @@ import os
 import logging
 import uuid
 import time
+import threading
 from datetime import datetime
-from flask import Flask, request, jsonify
+from functools import lru_cache
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -22,6 +25,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _dump_method(cls):
+    """Resolve the dict conversion method for a result type once."""
+    for name in ('model_dump', 'dict'):
+        method = getattr(cls, name, None)
+        if callable(method):
+            return method
+    return None
+
+
+def _dumps(payload):
+    """Serialize a payload to compact JSON bytes with orjson."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _json_response(payload, status=200):
+    """Build a JSON response from a payload."""
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+
+def _to_dict(value):
+    """Convert an agent result to a dict, or None if it can't be."""
+    if isinstance(value, dict):
+        return value
+    dump = _dump_method(type(value))
+    return dump(value) if dump is not None else None
+
+
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
@@ -42,17 +73,40 @@ def create_app():
     
     # Lazy load the agent to avoid import issues
     agent = None
+    agent_lock = threading.Lock()
     
     def get_agent():
         """Lazy load the agent on first use."""
         nonlocal agent
         if agent is None:
-            logger.info("Initializing agent for first time...")
-            from exa_local import agent as exa_agent
-            agent = exa_agent
-            logger.info("Agent initialized successfully")
+            with agent_lock:
+                # Another thread may have finished loading while we waited
+                if agent is None:
+                    logger.info("Initializing agent for first time...")
+                    from exa_local import agent as exa_agent
+                    agent = exa_agent
+                    logger.info("Agent initialized successfully")
         return agent
     
+    # Preload the agent so the first request doesn't pay for initialization.
+    # Under gunicorn --preload this runs once in the master before forking.
+    if os.getenv('PRELOAD_AGENT', '1') == '1':
+        try:
+            get_agent()
+        except Exception as e:
+            logger.warning(f"Agent preload failed, will retry on first request: {e}")
+    
+    # Snapshot API key status once; the environment doesn't change after startup
+    openrouter_key = bool(os.getenv('OPENROUTER_API_KEY'))
+    exa_key = bool(os.getenv('EXA_API_KEY'))
+    all_keys_present = openrouter_key and exa_key
+    health_status = "healthy" if all_keys_present else "degraded"
+    health_status_code = 200 if all_keys_present else 503
+    health_services = {
+        "openrouter_api": "configured" if openrouter_key else "missing",
+        "exa_api": "configured" if exa_key else "missing"
+    }
+    
     @app.route('/health', methods=['GET'])
     def health_check():
         """
@@ -60,30 +114,18 @@ def create_app():
         Returns the status of required API keys.
         """
         try:
-            # Check required environment variables
-            openrouter_key = bool(os.getenv('OPENROUTER_API_KEY'))
-            exa_key = bool(os.getenv('EXA_API_KEY'))
-            
-            # Overall health
-            all_keys_present = openrouter_key and exa_key
-            status = "healthy" if all_keys_present else "degraded"
-            status_code = 200 if all_keys_present else 503
-            
-            return jsonify({
-                "status": status,
+            return _json_response({
+                "status": health_status,
                 "version": "1.0.0",
                 "timestamp": datetime.now().isoformat(),
-                "services": {
-                    "openrouter_api": "configured" if openrouter_key else "missing",
-                    "exa_api": "configured" if exa_key else "missing"
-                }
-            }), status_code
+                "services": health_services
+            }, status=health_status_code)
         except Exception as e:
             logger.error(f"Health check error: {e}")
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "error": str(e)
-            }), 500
+            }, status=500)
     
     @app.route('/enrich', methods=['POST'])
     def enrich():
@@ -102,10 +144,10 @@ def create_app():
             # Parse request
             data = request.get_json()
             if not data or 'query' not in data:
-                return jsonify({
+                return _json_response({
                     "error": "Invalid request",
                     "detail": "Missing 'query' field"
-                }), 400
+                }, status=400)
             
             query = data['query']
             request_id = str(uuid.uuid4())
@@ -125,35 +167,24 @@ def create_app():
                 if hasattr(results, 'content'):
                     # RunResponse object - extract the content
                     logger.info(f"Extracting content from RunResponse")
-                    if isinstance(results.content, dict):
-                        results_dict = results.content
-                    elif hasattr(results.content, 'model_dump'):
-                        results_dict = results.content.model_dump()
-                    elif hasattr(results.content, 'dict'):
-                        results_dict = results.content.dict()
-                    else:
+                    results_dict = _to_dict(results.content)
+                    if results_dict is None:
                         # Fallback - try to convert to dict
                         results_dict = {"data": str(results.content)}
-                elif hasattr(results, 'model_dump'):
-                    # Pydantic model
-                    results_dict = results.model_dump()
-                elif hasattr(results, 'dict'):
-                    # Older Pydantic model
-                    results_dict = results.dict()
-                elif isinstance(results, dict):
-                    # Already a dict
-                    results_dict = results
                 else:
-                    # Fallback - convert to string
-                    logger.warning(f"Unknown result type: {type(results)}, converting to string")
-                    results_dict = {"data": str(results)}
+                    # Pydantic model (new or old API) or plain dict
+                    results_dict = _to_dict(results)
+                    if results_dict is None:
+                        # Fallback - convert to string
+                        logger.warning(f"Unknown result type: {type(results)}, converting to string")
+                        results_dict = {"data": str(results)}
                 
                 logger.info(f"Results converted to dict")
                 
                 processing_time = time.time() - start_time
                 logger.info(f"Request {request_id} completed in {processing_time:.2f}s")
                 
-                return jsonify({
+                return _json_response({
                     "request_id": request_id,
                     "query": query,
                     "status": "success",
@@ -165,60 +196,63 @@ def create_app():
                 logger.error(f"Agent error for {request_id}: {str(e)}")
                 processing_time = time.time() - start_time
                 
-                return jsonify({
+                return _json_response({
                     "request_id": request_id,
                     "query": query,
                     "status": "error",
                     "processing_time": processing_time,
                     "error": str(e)
-                }), 500
+                }, status=500)
                 
         except Exception as e:
             logger.error(f"Request error: {e}")
-            return jsonify({
+            return _json_response({
                 "error": "Invalid request",
                 "detail": str(e)
-            }), 400
+            }, status=400)
     
     @app.route('/test', methods=['GET', 'POST'])
     def test_endpoint():
         """Simple test endpoint to verify API is working."""
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "message": "Test endpoint working",
             "timestamp": datetime.now().isoformat(),
             "method": request.method
         })
     
+    # The API information payload never changes, so serialize it once
+    index_body = _dumps({
+        "name": "Exa Lead Enrichment API",
+        "version": "1.0.0",
+        "description": "AI-powered contact enrichment for business domains",
+        "endpoints": {
+            "enrich": {
+                "path": "/enrich",
+                "method": "POST",
+                "description": "Enrich business domain with contact information",
+                "example_request": {
+                    "query": "superintendent at pebblebeach.com"
+                }
+            },
+            "health": {
+                "path": "/health",
+                "method": "GET",
+                "description": "Check API health and service status"
+            }
+        },
+        "example_queries": [
+            "superintendent at pebblebeach.com",
+            "general manager at olivegarden.com in San Antonio",
+            "owner of joes-plumbing.com",
+            "head chef at frenchlaundry.com"
+        ]
+    })
+    
     @app.route('/')
     def index():
         """API information endpoint."""
-        return jsonify({
-            "name": "Exa Lead Enrichment API",
-            "version": "1.0.0",
-            "description": "AI-powered contact enrichment for business domains",
-            "endpoints": {
-                "enrich": {
-                    "path": "/enrich",
-                    "method": "POST",
-                    "description": "Enrich business domain with contact information",
-                    "example_request": {
-                        "query": "superintendent at pebblebeach.com"
-                    }
-                },
-                "health": {
-                    "path": "/health",
-                    "method": "GET",
-                    "description": "Check API health and service status"
-                }
-            },
-            "example_queries": [
-                "superintendent at pebblebeach.com",
-                "general manager at olivegarden.com in San Antonio",
-                "owner of joes-plumbing.com",
-                "head chef at frenchlaundry.com"
-            ]
-        })
+        return Response(index_body, mimetype='application/json')
     
     logger.info("Exa Lead Enrichment API initialized")
     return app
@@ -241,6 +275,8 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', 5001))  # Different port from mapper API
     debug = os.getenv('FLASK_ENV') == 'development'
     
+    # Flask's development server handles one request at a time; production
+    # runs through gunicorn (see start.sh / Procfile)
     logger.info(f"Starting Exa Lead Enrichment API on {host}:{port}")
     logger.info(f"Environment: {os.getenv('FLASK_ENV', 'production')}")
     
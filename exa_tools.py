@@ -0,0 +1,213 @@
+"""
+Exa search tools for the lead generation agent.
+Keeps tool returns small so search results don't flood the model's context.
+"""
+import functools
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import diskcache
+from agno.tools.exa import ExaTools
+from agno.utils.log import log_info, logger
+
+_DAY = 24 * 60 * 60
+_SEARCH_TTL = 7 * _DAY
+_CONTENTS_TTL = 30 * _DAY
+
+
+def _cached(ttl):
+    """Cache a tool method's return on disk, keyed on tool name and arguments."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.cache is None:
+                return method(self, *args, **kwargs)
+            payload = json.dumps([method.__name__, self._cache_salt, args, kwargs], sort_keys=True, default=str)
+            key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+            result = self.cache.get(key)
+            if result is not None:
+                return result
+            result = method(self, *args, **kwargs)
+            # Errors and timeouts are retried on the next call
+            if not result.startswith("Error"):
+                self.cache.set(key, result, expire=ttl)
+            return result
+        return wrapper
+    return decorator
+
+
+class BoundedExaTools(ExaTools):
+    """
+    ExaTools that bound what each tool call returns to the model.
+
+    search_exa and find_similar return only the url, title, date, first few
+    highlights and summary of each result; full page text comes back from
+    get_contents only. Every return is capped at max_output_chars.
+
+    Returns are cached on disk under cache_dir (EXA_CACHE_DIR, default
+    .exa_cache) so repeated queries skip the network; pass cache_dir=""
+    to disable.
+    """
+
+    def __init__(self, result_char_limit=500, max_highlights=2, max_output_chars=32000, cache_dir=None, **kwargs):
+        # Page text is only fetched by get_contents
+        kwargs.setdefault("text", False)
+        super().__init__(**kwargs)
+        self.result_char_limit = result_char_limit
+        self.max_highlights = max_highlights
+        self.max_output_chars = max_output_chars
+
+        if cache_dir is None:
+            cache_dir = os.getenv("EXA_CACHE_DIR", ".exa_cache")
+        self.cache = diskcache.Cache(cache_dir, size_limit=2**30) if cache_dir else None
+        # Settings that change what a tool returns are part of the cache key
+        self._cache_salt = [
+            self.num_results, self.text_length_limit, self.highlights, self.summary,
+            result_char_limit, max_highlights, max_output_chars,
+        ]
+
+    search_exa = _cached(_SEARCH_TTL)(ExaTools.search_exa)
+    find_similar = _cached(_SEARCH_TTL)(ExaTools.find_similar)
+
+    @_cached(_SEARCH_TTL)
+    def exa_answer(self, query: str, text: bool = False) -> str:
+        """
+        Get an LLM answer to a question informed by Exa search results.
+
+        Args:
+            query (str): The question or query to answer.
+            text (bool): Include full text from citation. Default is False.
+        Returns:
+            str: The answer results in JSON format with both generated answer and sources.
+        """
+        output = super().exa_answer(query, text=text)
+        if output.startswith("Error"):
+            return output
+
+        # Drop trailing citations until the answer fits the budget, then cut
+        # the answer text itself if it is still too long
+        result = json.loads(output)
+        output = json.dumps(result, ensure_ascii=False)
+        citations = result.get("citations") or []
+        while len(output) > self.max_output_chars and citations:
+            citations.pop()
+            output = json.dumps(result, ensure_ascii=False)
+        answer = result.get("answer")
+        while len(output) > self.max_output_chars and isinstance(answer, str) and answer:
+            # Cut in proportion to the serialized length, which escapes can inflate
+            serialized = len(json.dumps(answer, ensure_ascii=False))
+            keep = len(answer) * (serialized - (len(output) - self.max_output_chars)) // serialized
+            answer = answer[: max(0, min(keep, len(answer) - 1))]
+            result["answer"] = answer
+            output = json.dumps(result, ensure_ascii=False)
+        return output
+
+    def _parse_results(self, exa_results, include_text=False):
+        """Convert Exa results into a compact JSON string."""
+        parsed = []
+        for result in exa_results.results:
+            result_dict = {"url": result.url}
+            if result.title:
+                result_dict["title"] = result.title
+            if result.published_date:
+                result_dict["published_date"] = result.published_date
+            if include_text and result.text:
+                result_dict["text"] = result.text[: self.text_length_limit]
+            highlights = getattr(result, "highlights", None)
+            if self.highlights and highlights:
+                result_dict["highlights"] = [h[: self.result_char_limit] for h in highlights[: self.max_highlights]]
+            summary = getattr(result, "summary", None)
+            if self.summary and summary:
+                result_dict["summary"] = summary[: self.result_char_limit]
+            parsed.append(result_dict)
+        return self._bounded_dumps(parsed)
+
+    def _bounded_dumps(self, parsed):
+        """Serialize results, dropping trailing ones until the output fits the budget."""
+        output = json.dumps(parsed, ensure_ascii=False)
+        while len(output) > self.max_output_chars and len(parsed) > 1:
+            parsed = parsed[:-1]
+            output = json.dumps(parsed, ensure_ascii=False)
+        return output
+
+    @_cached(_CONTENTS_TTL)
+    def get_contents(self, urls: list[str]) -> str:
+        """
+        Retrieve detailed content from specific URLs using the Exa API.
+
+        Args:
+            urls (list(str)): A list of URLs from which to fetch content.
+
+        Returns:
+            str: The page contents in JSON format.
+        """
+        try:
+            if self.show_results:
+                log_info(f"Fetching contents for URLs: {urls}")
+
+            # Text is trimmed server-side to text_length_limit
+            exa_results = self._execute_with_timeout(
+                self.exa.get_contents,
+                urls=urls,
+                text={"max_characters": self.text_length_limit},
+                highlights=self.highlights,
+                summary=self.summary,
+            )
+
+            parsed_results = self._parse_results(exa_results, include_text=True)
+            if self.show_results:
+                log_info(parsed_results)
+
+            return parsed_results
+        except TimeoutError as e:
+            logger.error(f"Get contents timed out after {self.timeout} seconds")
+            return f"Error: {str(e)}"
+        except Exception as e:
+            logger.error(f"Failed to get contents from Exa: {e}")
+            return f"Error: {e}"
+
+
+class BatchExaTools(BoundedExaTools):
+    """BoundedExaTools with a batch_search tool that runs several searches concurrently."""
+
+    def __init__(self, max_concurrency=8, **kwargs):
+        super().__init__(**kwargs)
+        # Caps parallel requests to stay within Exa rate limits
+        self.max_concurrency = max_concurrency
+        self.register(self.batch_search)
+
+    def batch_search(self, queries: list[str], num_results: int = 5) -> str:
+        """Use this function to run several Exa searches at once.
+        Prefer it over repeated search_exa calls when you have 3 or more related queries.
+
+        Args:
+            queries (list(str)): The queries to search for.
+            num_results (int): Number of results to return per query. Defaults to 5.
+
+        Returns:
+            str: A JSON object mapping each query to its search results. Trailing
+                queries are left out if the results would not fit the output budget.
+        """
+        if not queries:
+            return "{}"
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(queries))) as executor:
+            outputs = list(executor.map(lambda query: self.search_exa(query=query, num_results=num_results), queries))
+
+        results = {}
+        for query, output in zip(queries, outputs):
+            results[query] = output if output.startswith("Error") else json.loads(output)
+
+        # Trim the longest result lists, then drop whole queries from the end,
+        # until the combined return fits the budget
+        output = json.dumps(results, ensure_ascii=False)
+        while len(output) > self.max_output_chars and results:
+            lists = [value for value in results.values() if isinstance(value, list) and len(value) > 1]
+            if lists:
+                max(lists, key=len).pop()
+            else:
+                results.popitem()
+            output = json.dumps(results, ensure_ascii=False)
+        return output
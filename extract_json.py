@@ -3,36 +3,82 @@ import json
 import re
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+import ahocorasick
+import orjson
+from pydantic import ValidationError
+from lead_models import LocalLeadResults
+
+_RESULTS_RE = re.compile(r'LocalLeadResults:\s*\n([\s\S]*?)(?:\n\n|\Z)')
+
+# Contact-name fallback: one automaton pass finds the "Name:"/"Contact:" labels,
+# then the name pattern is only tried right after each hit. Hits inside a
+# previous match are skipped, so results match re.findall's non-overlapping scan
+_LABELS = ahocorasick.Automaton()
+for _label in ('Name:', 'Contact:'):
+    _LABELS.add_word(_label, _label)
+_LABELS.make_automaton()
+_NAME_RE = re.compile(r'\s*([A-Z][a-z]+ [A-Z][a-z]+)')
+
+def _find_contact_names(content):
+    """Return names following "Name:" or "Contact:" labels, in order of appearance."""
+    names = []
+    pos = 0
+    for end_index, label in _LABELS.iter(content):
+        if end_index - len(label) + 1 < pos:
+            continue
+        match = _NAME_RE.match(content, end_index + 1)
+        if match:
+            names.append(match.group(1))
+            pos = match.end()
+    return names
+
+def _iter_json_objects(text):
+    """Yield (object, start, end) for each top-level JSON value starting at a '{' in text."""
+    # Stays on the stdlib decoder: orjson has no raw_decode to report where a value ends
+    decoder = json.JSONDecoder()
+    i = 0
+    while True:
+        start = text.find('{', i)
+        if start < 0:
+            return
+        try:
+            obj, end = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            i = start + 1
+            continue
+        yield obj, start, end
+        i = end
 
 def extract_json_from_file(filepath):
     """Extract JSON object from a model output file."""
     with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Strategy 1: Look for specific patterns that indicate JSON response
-    patterns = [
-        r'```json\n([\s\S]*?)\n```',  # JSON in code blocks
-        r'```\n(\{[\s\S]*?\})\n```',  # JSON in generic code blocks
-        r'(\{[^{}]*"business"[^{}]*:[\s\S]*?\n\})',  # Simple JSON with business key
-        r'(\{\s*"business"\s*:[\s\S]*?"metadata"\s*:[\s\S]*?\})',  # Full LocalLeadResults structure
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-        if matches:
-            for match in matches:
-                try:
-                    # Try to parse as JSON
-                    json_obj = json.loads(match)
-                    # Verify it has expected structure
-                    if 'business' in json_obj and 'contacts' in json_obj:
-                        return json_obj
-                except:
-                    continue
+        return extract_json_from_text(f.read())
+
+def extract_json_from_text(content):
+    """
+    Extract JSON object from model output text.
+    Returns a dict: the validated LocalLeadResults when the output contains
+    a valid one, otherwise the best-effort object (or None).
+    """
+    # Strategy 1: Scan every embedded JSON object once, returning the first
+    # valid LocalLeadResults and remembering the largest otherwise
+    largest = None
+    largest_len = 0
+    for obj, start, end in _iter_json_objects(content):
+        if not isinstance(obj, dict):
+            continue
+        # Verify it has expected structure, validating straight from the raw text
+        if 'business' in obj and 'contacts' in obj:
+            try:
+                return LocalLeadResults.model_validate_json(content[start:end]).model_dump(mode='json')
+            except ValidationError:
+                pass
+        if len(obj) > 2 and end - start > largest_len:  # At least some complexity
+            largest, largest_len = obj, end - start
     
     # Strategy 2: Look for structured output after "LocalLeadResults:"
-    results_pattern = r'LocalLeadResults:\s*\n([\s\S]*?)(?:\n\n|\Z)'
-    match = re.search(results_pattern, content)
+    match = _RESULTS_RE.search(content)
     if match:
         results_text = match.group(1)
         
@@ -42,28 +88,11 @@ def extract_json_from_file(filepath):
             json_obj = parse_structured_output(results_text)
             if json_obj:
                 return json_obj
-        except:
+        except json.JSONDecodeError:
             pass
     
-    # Strategy 3: Find the largest valid JSON object in the file
-    # Look for all potential JSON objects
-    potential_jsons = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', content)
-    
-    valid_jsons = []
-    for potential in potential_jsons:
-        try:
-            obj = json.loads(potential)
-            if isinstance(obj, dict) and len(obj) > 2:  # At least some complexity
-                valid_jsons.append((len(potential), obj))
-        except:
-            continue
-    
-    # Return the largest valid JSON
-    if valid_jsons:
-        valid_jsons.sort(key=lambda x: x[0], reverse=True)
-        return valid_jsons[0][1]
-    
-    return None
+    # Strategy 3: Return the largest valid JSON object in the file
+    return largest
 
 def parse_structured_output(text):
     """Parse the structured text output into JSON format."""
@@ -71,45 +100,79 @@ def parse_structured_output(text):
     # For now, return None to try other strategies
     return None
 
-def process_model_outputs(output_dir):
-    """Process all model output files and extract JSON."""
-    results = {}
+def _extract_and_save(filepath, output_dir, model_name):
+    """
+    Extract JSON from one model output file and save it as <model>.json.
+    Returns the JSON (or None) and, when extraction fails, the contact names
+    found in the text so the file doesn't need to be read again.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
     
-    for filename in os.listdir(output_dir):
-        if filename.endswith('_output.txt'):
-            model_name = filename.replace('_output.txt', '')
-            filepath = os.path.join(output_dir, filename)
-            
+    json_data = extract_json_from_text(content)
+    if not json_data:
+        # Look for contact names to verify we have results
+        return None, _find_contact_names(content)
+    
+    # Save individual JSON file
+    json_filepath = os.path.join(output_dir, f"{model_name}.json")
+    with open(json_filepath, 'wb') as f:
+        f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    return json_data, []
+
+def iter_model_outputs(output_dir):
+    """Extract JSON from every model output file, yielding (model_name, json_data) in listing order."""
+    with os.scandir(output_dir) as entries:
+        files = [
+            (entry.name[:-len('_output.txt')], entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith('_output.txt')
+        ]
+    
+    # Overlap file reads and parsing across threads; report in listing order
+    with ThreadPoolExecutor(max_workers=min(8, len(files) or 1)) as executor:
+        futures = [
+            (model_name, executor.submit(_extract_and_save, filepath, output_dir, model_name))
+            for model_name, filepath in files
+        ]
+        
+        for model_name, future in futures:
             print(f"Processing {model_name}...")
-            json_data = extract_json_from_file(filepath)
+            json_data, contacts = future.result()
             
             if json_data:
-                results[model_name] = json_data
-                # Save individual JSON file
-                json_filepath = os.path.join(output_dir, f"{model_name}.json")
-                with open(json_filepath, 'w') as f:
-                    json.dump(json_data, f, indent=2)
                 print(f"  ✓ Extracted JSON for {model_name}")
+                yield model_name, json_data
             else:
                 print(f"  ✗ Could not extract JSON for {model_name}")
-                # Let's examine what's in the file
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    # Look for contact names to verify we have results
-                    contacts = re.findall(r'(?:Name|Contact):\s*([A-Z][a-z]+ [A-Z][a-z]+)', content)
-                    if contacts:
-                        print(f"    Found contacts: {', '.join(set(contacts[:5]))}")
-    
-    return results
+                if contacts:
+                    print(f"    Found contacts: {', '.join(set(contacts[:5]))}")
+
+def process_model_outputs(output_dir):
+    """Process all model output files and extract JSON."""
+    return dict(iter_model_outputs(output_dir))
 
 if __name__ == "__main__":
     output_dir = "model_outputs"
-    results = process_model_outputs(output_dir)
+    # --json also writes the combined, indented all_models_extracted.json
+    write_combined_json = '--json' in sys.argv[1:]
+    ndjson_path = os.path.join(output_dir, "all_models_extracted.ndjson")
+    results = {}
+    extracted = 0
+    
+    # Append one {"model", "data"} line per model as soon as it is extracted
+    with open(ndjson_path, 'wb') as out:
+        for model_name, json_data in iter_model_outputs(output_dir):
+            out.write(orjson.dumps({"model": model_name, "data": json_data}) + b"\n")
+            extracted += 1
+            if write_combined_json:
+                results[model_name] = json_data
     
-    # Save combined results
-    if results:
-        with open(os.path.join(output_dir, "all_models_extracted.json"), 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"\nExtracted JSON from {len(results)} models")
+    if extracted:
+        if write_combined_json:
+            with open(os.path.join(output_dir, "all_models_extracted.json"), 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        print(f"\nExtracted JSON from {extracted} models")
     else:
+        os.remove(ndjson_path)
         print("\nNo JSON could be extracted from any model outputs")
\ No newline at end of file
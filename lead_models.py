@@ -0,0 +1,125 @@
+"""
+Output models for local lead generation results.
+Shared by the agent and the extraction scripts without initializing the agent.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
+
+def _strip_descriptions(schema):
+    """Drop per-field descriptions from a JSON schema, including nested $defs."""
+    for definition in (schema, *schema.get("$defs", {}).values()):
+        for prop in definition.get("properties", {}).values():
+            prop.pop("description", None)
+    return schema
+
+# --- Local Lead Generation Output Model Definitions ---
+class PreviousRole(BaseModel):
+    """A model to structure information about a contact's previous roles."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
+
+    title: str = Field(..., description="The job title of the previous role.")
+    company: str = Field(..., description="The company/business of the previous role.")
+    duration: Optional[str] = Field(None, description="Duration in the role (e.g., '2019-2021' or '2 years').")
+
+# Current employment status of a contact at the business:
+# CURRENT verified within last 6 months, LIKELY_CURRENT evidence within 12 months,
+# UNCERTAIN data older than 12 months, FORMER confirmed to have left
+EmploymentStatus = Literal["CURRENT", "LIKELY_CURRENT", "UNCERTAIN", "FORMER"]
+
+# How recent the employment verification is: RECENT < 6 months, MODERATE 6-12 months, DATED > 12 months
+VerificationRecency = Literal["RECENT", "MODERATE", "DATED"]
+
+# Type of phone number found: main business line, direct extension, personal/mobile, or undetermined
+PhoneType = Literal["BUSINESS_MAIN", "BUSINESS_DIRECT", "PERSONAL", "UNKNOWN"]
+
+# Type of email address found: DIRECT personal work email (john.smith@company.com),
+# GENERIC role email (info@, contact@, sales@), PATTERN built from the company pattern,
+# NOT_FOUND no email found, using fallback
+EmailType = Literal["DIRECT", "GENERIC", "PATTERN", "NOT_FOUND"]
+
+# Overall confidence in the search results
+SearchConfidence = Literal["HIGH", "MEDIUM", "LOW"]
+
+class LocalContact(BaseModel):
+    """Model for local business contact information suitable for lead generation."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
+
+    name: str = Field(..., description="The full name of the contact.")
+    title: str = Field(..., description="Current job title (e.g., 'Superintendent', 'General Manager', 'Owner').")
+    business_name: str = Field(..., description="The name of the business where they work.")
+    business_website: Optional[str] = Field(None, description="The business website URL.")
+    phone: Optional[str] = Field(None, description="Contact phone number (business or direct).")
+    phone_type: Optional[PhoneType] = Field(None, description="Type of phone number: 'BUSINESS_MAIN', 'BUSINESS_DIRECT', 'PERSONAL', or 'UNKNOWN'")
+    email: str = Field(..., description="Contact email address. Always provided - either direct email or constructed pattern.")
+    email_type: EmailType = Field(..., description="Type of email: 'DIRECT', 'GENERIC', 'PATTERN', or 'NOT_FOUND'")
+    email_pattern: Optional[str] = Field(None, description="Common email pattern for the company (e.g., 'first.last@domain.com', 'flast@domain.com')")
+    address: Optional[str] = Field(None, description="Business address or location.")
+    linkedin_url: Optional[str] = Field(None, description="LinkedIn profile URL if available.")
+    years_in_position: Optional[str] = Field(None, description="How long they've been in current role.")
+    employment_status: EmploymentStatus = Field(..., description="Current employment status: 'CURRENT', 'LIKELY_CURRENT', 'UNCERTAIN', 'FORMER'")
+    last_verified_date: Optional[str] = Field(None, description="Date when employment was last verified (ISO format or 'YYYY-MM')")
+    verification_recency: VerificationRecency = Field(..., description="How recent the verification is: 'RECENT' (<6mo), 'MODERATE' (6-12mo), 'DATED' (>12mo)")
+    background_summary: str = Field(..., description="Brief summary of their role and responsibilities.")
+    previous_roles: Optional[List[PreviousRole]] = Field(None, description="Previous positions if available.")
+    source_urls: List[str] = Field(..., description="URLs where the information was found.")
+    confidence_score: float = Field(..., description="Confidence score (0.0-1.0) based on data quality.")
+    verification_notes: Optional[str] = Field(None, description="Notes about data verification.")
+
+class LocalBusiness(BaseModel):
+    """Structured information about a local business."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
+
+    name: str = Field(..., description="Official business name.")
+    address: Optional[str] = Field(None, description="Physical address of the business.")
+    phone: Optional[str] = Field(None, description="Main business phone number.")
+    website_url: Optional[str] = Field(None, description="Business website URL.")
+    business_type: str = Field(..., description="Type of business (e.g., 'Golf Course', 'Restaurant', 'Retail').")
+    description: str = Field(..., description="Brief description of what the business does.")
+    services_offered: Optional[List[str]] = Field(None, description="Key services or products offered.")
+    operating_hours: Optional[str] = Field(None, description="Business hours of operation.")
+    years_established: Optional[int] = Field(None, description="Year the business was established.")
+    employee_count_estimate: Optional[str] = Field(None, description="Estimated number of employees.")
+    review_rating: Optional[float] = Field(None, description="Average review rating if available.")
+    specialties: Optional[List[str]] = Field(None, description="Business specialties or unique offerings.")
+    location_details: Optional[str] = Field(None, description="Additional location context (neighborhood, nearby landmarks).")
+
+class SearchMetadata(BaseModel):
+    """Metadata about the search process and methods used."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra='ignore')
+
+    search_terms_used: List[str] = Field(..., description="Actual search queries executed.")
+    sources_searched: List[str] = Field(..., description="Sources checked (e.g., 'Business Website', 'LinkedIn', 'Local Directories').")
+    verification_methods: List[str] = Field(..., description="Methods used to verify information.")
+    total_results_analyzed: int = Field(..., description="Number of search results analyzed.")
+    job_titles_searched: List[str] = Field(..., description="Specific job titles searched for.")
+    search_location: Optional[str] = Field(None, description="Geographic location if location-based search.")
+    search_radius: Optional[str] = Field(None, description="Search radius if applicable.")
+    email_pattern_detected: Optional[str] = Field(None, description="Company email pattern detected (e.g., 'first.last@domain.com')")
+    emails_found_count: int = Field(0, description="Number of direct emails found vs constructed")
+    challenges_encountered: Optional[List[str]] = Field(None, description="Any difficulties during search.")
+
+class LocalLeadResults(BaseModel):
+    """Structured output for local lead generation results."""
+    # Validators and serializers are built on first use, not at import
+    model_config = ConfigDict(defer_build=True, validate_assignment=False, extra='ignore')
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs):
+        """
+        Schema sent to the LLM as the response format, without field descriptions.
+        The descriptions stay on the fields as developer docs. Allowed enum values
+        stay in the schema as Literal types; the agent instructions explain them.
+        """
+        return _strip_descriptions(super().model_json_schema(*args, **kwargs))
+
+    # Business Section
+    business: LocalBusiness = Field(..., description="Verified business information.")
+    
+    # Contacts Section
+    contacts: List[LocalContact] = Field(..., description="List of contacts found at the business.")
+    contacts_found: int = Field(..., description="Total number of contacts found.")
+    
+    # Metadata Section
+    metadata: SearchMetadata = Field(..., description="Search process metadata.")
+    search_confidence: SearchConfidence = Field(..., description="Overall confidence: 'HIGH', 'MEDIUM', or 'LOW'.")
+    search_query: str = Field(..., description="Original search query.")
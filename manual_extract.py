@@ -1,30 +1,95 @@
 #!/usr/bin/env python3
-import json
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor
+import orjson
+
+# all_extractions.json is the combined output; set EXTRACT_PER_MODEL=1 to also
+# write a <model>.json per model
+WRITE_PER_MODEL = os.environ.get('EXTRACT_PER_MODEL') == '1'
+
+# The business these outputs were generated for; string literals are already
+# shared constants, but one source_urls tuple avoids a new list per contact
+_BUSINESS_NAME = "Dead Horse Lake Golf Course"
+_BUSINESS_DOMAIN = "deadhorselake.com"
+_SOURCE_URLS = (_BUSINESS_DOMAIN,)
+
+# Patterns stay on re: RE2's \s and \d are ASCII-only, while re's also match
+# Unicode whitespace and digits such as non-breaking spaces in model text.
+# Flags are written inline, and only where a pattern has '^', '$' or '.' for them to change.
+
+# Section patterns
+_RESULTS_RE = re.compile(r'(?s)LocalLeadResults:(.*?)(?:┗━|$)')
+_RESPONSE_RE = re.compile(r'(?s)(?:Response.*?\n)(.*?)$')
+_CONTACT_SPLIT_RE = re.compile(r'(?:\d+\.\s+Contact\s+\d+:|Contact\s+\d+:|^\d+\.\s+)')
+_ALT_CONTACT_RE = re.compile(r'(?:^|\n)\s*\d+\.\s+([^-\n]+)\s*-\s*([^\n]+)')
+
+# Business field patterns
+_BUSINESS_NAME_RE = re.compile(r'(?:Business\s+)?Name:\s*(.+)')
+_TYPE_RE = re.compile(r'Type:\s*(.+)')
+_ADDRESS_RE = re.compile(r'Address:\s*(.+)')
+_MAIN_PHONE_RE = re.compile(r'(?:Main\s+)?Phone:\s*(.+)')
+_WEBSITE_RE = re.compile(r'Website:\s*(.+)')
+_DESCRIPTION_RE = re.compile(r'Description:\s*(.+)')
+_YEAR_RE = re.compile(r'(?:Since|Established|Years?)\s*(?:in\s+)?(\d{4})')
+_SERVICES_RE = re.compile(r'(?:Services|Amenities):\s*(.+)')
+_SERVICES_SEP_RE = re.compile(r'[,/]')
+_HOURS_RE = re.compile(r'(?s)(?:Hours|Operating Hours):\s*(.+?)(?:\n|$)')
+
+# Contact field patterns
+_CONTACT_NAME_RE = re.compile(r'(?m)(?:^|\n)\s*(?:-\s+)?Name:\s*(.+)')
+_TITLE_RE = re.compile(r'Title:\s*(.+)')
+_PHONE_RE = re.compile(r'Phone:\s*([^\(]+)')
+_PHONE_TYPE_RE = re.compile(r'Type:\s*(\w+)')
+_EMAIL_RE = re.compile(r'Email:\s*([^\s\(]+)')
+_EMAIL_TYPE_RE = re.compile(r'Email.*?\(Type:\s*(\w+)\)')
+_EMPLOYMENT_RE = re.compile(r'Employment Status:\s*(\w+)')
+_VERIFICATION_RE = re.compile(r'Verification:\s*(\w+)')
+_BACKGROUND_RE = re.compile(r'Background:\s*(.+)')
+_CONFIDENCE_RE = re.compile(r'(?:Confidence|Score):\s*([\d.]+)')
+
+# Every contact field pattern starts with its label, so one scan for the labels
+# finds all candidate positions; each field's pattern is then only tried there.
+# Taking the first success per field gives the same values as separate searches.
+_CONTACT_LABEL_RE = re.compile(r'Title:|Phone:|Type:|Email|Employment Status:|Verification:|Background:|Confidence:|Score:')
+_CONTACT_FIELDS_BY_LABEL = {
+    'Title:': (('title', _TITLE_RE),),
+    'Phone:': (('phone', _PHONE_RE),),
+    'Type:': (('phone_type', _PHONE_TYPE_RE),),
+    'Email': (('email', _EMAIL_RE), ('email_type', _EMAIL_TYPE_RE)),
+    'Employment Status:': (('employment_status', _EMPLOYMENT_RE),),
+    'Verification:': (('verification_recency', _VERIFICATION_RE),),
+    'Background:': (('background_summary', _BACKGROUND_RE),),
+    'Confidence:': (('confidence_score', _CONFIDENCE_RE),),
+    'Score:': (('confidence_score', _CONFIDENCE_RE),),
+}
+_CONTACT_FIELD_COUNT = len({field for fields in _CONTACT_FIELDS_BY_LABEL.values() for field, _ in fields})
 
 def extract_contacts_from_text(content):
     """Extract contact information from structured text output."""
     
     # Find the LocalLeadResults section
-    results_match = re.search(r'LocalLeadResults:(.*?)(?:┗━|$)', content, re.DOTALL)
+    results_match = _RESULTS_RE.search(content)
     if not results_match:
         # Try alternative patterns
-        results_match = re.search(r'(?:Response.*?\n)(.*?)$', content, re.DOTALL)
+        results_match = _RESPONSE_RE.search(content)
     
     if not results_match:
         return None
     
-    text = results_match.group(1)
+    return extract_contacts_from_section(results_match.group(1))
+
+def extract_contacts_from_section(text):
+    """Extract contact information from the LocalLeadResults section of an output."""
     
     # Extract business information
     business = {
-        "name": extract_field(text, r'(?:Business\s+)?Name:\s*(.+)'),
-        "business_type": extract_field(text, r'Type:\s*(.+)'),
-        "address": extract_field(text, r'Address:\s*(.+)'),
-        "phone": extract_field(text, r'(?:Main\s+)?Phone:\s*(.+)'),
-        "website_url": extract_field(text, r'Website:\s*(.+)'),
-        "description": extract_field(text, r'Description:\s*(.+)'),
+        "name": extract_field(text, _BUSINESS_NAME_RE, "Name:"),
+        "business_type": extract_field(text, _TYPE_RE, "Type:"),
+        "address": extract_field(text, _ADDRESS_RE, "Address:"),
+        "phone": extract_field(text, _MAIN_PHONE_RE, "Phone:"),
+        "website_url": extract_field(text, _WEBSITE_RE, "Website:"),
+        "description": extract_field(text, _DESCRIPTION_RE, "Description:"),
         "years_established": extract_year(text),
         "services_offered": extract_services(text),
         "operating_hours": extract_hours(text)
@@ -34,55 +99,56 @@ def extract_contacts_from_text(content):
     contacts = []
     
     # Look for contact sections
-    contact_sections = re.split(r'(?:\d+\.\s+Contact\s+\d+:|Contact\s+\d+:|^\d+\.\s+)', text)
-    
-    for section in contact_sections:
+    for section in iter_contact_sections(text):
         if not section.strip():
             continue
             
-        name = extract_field(section, r'(?:^|\n)\s*(?:-\s+)?Name:\s*(.+)')
-        if name and name != "Dead Horse Lake Golf Course":
+        name = extract_field(section, _CONTACT_NAME_RE, "Name:")
+        if name and name != _BUSINESS_NAME:
+            fields = extract_contact_fields(section)
+            
+            # A bare local part (no '@', not a domain) gets the business domain;
+            # the captured value never contains whitespace, so no strip is needed
+            email = fields.get("email")
+            if email and "@" not in email and not email.endswith(".com"):
+                email = f"{email}@{_BUSINESS_DOMAIN}"
+            
             contact = {
                 "name": name,
-                "title": extract_field(section, r'Title:\s*(.+)'),
-                "business_name": business["name"] or "Dead Horse Lake Golf Course",
-                "phone": extract_field(section, r'Phone:\s*([^\(]+)') or business["phone"],
-                "phone_type": extract_field(section, r'Type:\s*(\w+)') or "BUSINESS_MAIN",
-                "email": extract_field(section, r'Email:\s*([^\s\(]+)'),
-                "email_type": extract_field(section, r'Email.*?\(Type:\s*(\w+)\)') or "PATTERN",
-                "employment_status": extract_field(section, r'Employment Status:\s*(\w+)') or "CURRENT",
-                "verification_recency": extract_field(section, r'Verification:\s*(\w+)') or "RECENT",
-                "background_summary": extract_field(section, r'Background:\s*(.+)') or "Key leadership role",
-                "confidence_score": extract_confidence(section),
-                "source_urls": ["deadhorselake.com"]
+                "title": fields.get("title"),
+                "business_name": business["name"] or _BUSINESS_NAME,
+                "phone": fields.get("phone") or business["phone"],
+                "phone_type": fields.get("phone_type") or "BUSINESS_MAIN",
+                "email": email,
+                "email_type": fields.get("email_type") or "PATTERN",
+                "employment_status": fields.get("employment_status") or "CURRENT",
+                "verification_recency": fields.get("verification_recency") or "RECENT",
+                "background_summary": fields.get("background_summary") or "Key leadership role",
+                "confidence_score": float(fields["confidence_score"]) if "confidence_score" in fields else 0.9,
+                "source_urls": _SOURCE_URLS
             }
-            
-            # Clean up the contact data
-            if contact["email"] and not contact["email"].endswith(".com"):
-                contact["email"] = contact["email"].strip() + "@deadhorselake.com" if "@" not in contact["email"] else contact["email"]
-            
             contacts.append(contact)
     
     # If no contacts found with the above method, try alternative parsing
     if not contacts:
         # Look for patterns like "1. Name - Title"
-        alt_contacts = re.findall(r'(?:^|\n)\s*\d+\.\s+([^-\n]+)\s*-\s*([^\n]+)', text)
+        alt_contacts = _ALT_CONTACT_RE.findall(text)
         for name, title in alt_contacts:
             if name.strip() and "Dead Horse" not in name:
                 email_name = name.lower().replace(' ', '.')
                 contact = {
                     "name": name.strip(),
                     "title": title.strip(),
-                    "business_name": "Dead Horse Lake Golf Course",
+                    "business_name": _BUSINESS_NAME,
                     "phone": "(865) 693-5270",
                     "phone_type": "BUSINESS_MAIN",
-                    "email": f"{email_name}@deadhorselake.com",
+                    "email": f"{email_name}@{_BUSINESS_DOMAIN}",
                     "email_type": "PATTERN",
                     "employment_status": "CURRENT",
                     "verification_recency": "RECENT",
-                    "background_summary": f"{title.strip()} at Dead Horse Lake Golf Course",
+                    "background_summary": f"{title.strip()} at {_BUSINESS_NAME}",
                     "confidence_score": 0.8,
-                    "source_urls": ["deadhorselake.com"]
+                    "source_urls": _SOURCE_URLS
                 }
                 contacts.append(contact)
     
@@ -99,7 +165,7 @@ def extract_contacts_from_text(content):
             "job_titles_searched": ["Superintendent", "General Manager", "Director"],
             "search_location": "Knoxville, TN",
             "email_pattern_detected": "first.last@deadhorselake.com",
-            "emails_found_count": len([c for c in contacts if c.get("email_type") == "DIRECT"])
+            "emails_found_count": sum(1 for c in contacts if c.get("email_type") == "DIRECT")
         },
         "search_confidence": "HIGH" if len(contacts) >= 2 else "MEDIUM",
         "search_query": "leadership/superintendent/manager of deadhorselake.com in knoxville"
@@ -107,61 +173,135 @@ def extract_contacts_from_text(content):
     
     return result
 
-def extract_field(text, pattern):
-    """Extract a field using regex pattern."""
-    match = re.search(pattern, text, re.MULTILINE)
+def iter_contact_sections(text):
+    """Yield the text between contact headers, as _CONTACT_SPLIT_RE.split would, without building the list."""
+    start = 0
+    for match in _CONTACT_SPLIT_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+def extract_field(text, pattern, literal=None):
+    """
+    Extract a field using a compiled regex pattern.
+    literal is a label every match contains: when it is absent the regex is
+    skipped, otherwise the search starts at the line where it first appears.
+    """
+    pos = 0
+    if literal is not None:
+        pos = text.find(literal)
+        if pos < 0:
+            return None
+        # Line start keeps '^' and optional prefixes like "Business " matchable
+        pos = text.rfind('\n', 0, pos) + 1
+    match = pattern.search(text, pos)
     return match.group(1).strip() if match else None
 
+def extract_contact_fields(section):
+    """Extract the first value of each contact field in a single scan over the field labels."""
+    fields = {}
+    for label in _CONTACT_LABEL_RE.finditer(section):
+        for field, pattern in _CONTACT_FIELDS_BY_LABEL[label.group()]:
+            if field not in fields:
+                match = pattern.match(section, label.start())
+                if match:
+                    fields[field] = match.group(1).strip()
+        if len(fields) == _CONTACT_FIELD_COUNT:
+            break
+    return fields
+
 def extract_year(text):
     """Extract establishment year."""
-    match = re.search(r'(?:Since|Established|Years?)\s*(?:in\s+)?(\d{4})', text)
+    match = _YEAR_RE.search(text)
     return int(match.group(1)) if match else None
 
 def extract_services(text):
     """Extract services offered."""
-    match = re.search(r'(?:Services|Amenities):\s*(.+)', text)
+    match = _SERVICES_RE.search(text)
     if match:
         services = match.group(1).strip()
-        return [s.strip() for s in re.split(r'[,/]', services)]
+        return [s.strip() for s in _SERVICES_SEP_RE.split(services)]
     return None
 
 def extract_hours(text):
     """Extract operating hours."""
-    match = re.search(r'(?:Hours|Operating Hours):\s*(.+?)(?:\n|$)', text, re.DOTALL)
+    match = _HOURS_RE.search(text)
     if match:
         return match.group(1).strip()
     return None
 
-def extract_confidence(text):
-    """Extract confidence score."""
-    match = re.search(r'(?:Confidence|Score):\s*([\d.]+)', text)
-    return float(match.group(1)) if match else 0.9
+def _read_results_section(filepath):
+    """
+    Stream a model output file up to the end of its LocalLeadResults section.
+    Returns (section, None) with the text between the marker and the closing
+    '┗━' (or end of file), or (None, content) when the file has no marker.
+    """
+    marker = 'LocalLeadResults:'
+    with open(filepath, 'r', encoding='utf-8', buffering=65536) as f:
+        skipped = []
+        for line in f:
+            start = line.find(marker)
+            if start >= 0:
+                break
+            skipped.append(line)
+        else:
+            return None, ''.join(skipped)
+        
+        chunks = []
+        line = line[start + len(marker):]
+        while line:
+            end = line.find('┗━')
+            if end >= 0:
+                chunks.append(line[:end])
+                return ''.join(chunks), None
+            chunks.append(line)
+            line = next(f, '')
+    
+    # Like the regex's '$', the section stops before a final newline
+    section = ''.join(chunks)
+    return (section[:-1] if section.endswith('\n') else section), None
+
+def _process_one(filepath, output_dir, model_name):
+    """Extract contacts from one model output, saving them as <model>.json if WRITE_PER_MODEL is set."""
+    section, content = _read_results_section(filepath)
+    
+    # Extract contacts, searching the whole output only when it has no results section
+    if section is not None:
+        extracted = extract_contacts_from_section(section)
+    else:
+        extracted = extract_contacts_from_text(content)
+    
+    if extracted and extracted['contacts']:
+        if not WRITE_PER_MODEL:
+            return extracted
+        # Save individual JSON
+        json_path = os.path.join(output_dir, f"{model_name}.json")
+        with open(json_path, 'wb', buffering=65536) as f:
+            f.write(orjson.dumps(extracted, option=orjson.OPT_INDENT_2))
+        return extracted
+    return None
 
 def process_all_outputs():
     """Process all model outputs."""
     output_dir = "model_outputs"
     results = {}
     
-    # Process each model output
-    for filename in os.listdir(output_dir):
-        if filename.endswith('_output.txt'):
-            model_name = filename.replace('_output.txt', '')
-            filepath = os.path.join(output_dir, filename)
-            
+    # Process each model output in parallel
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {}
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('_output.txt') and entry.is_file(follow_symlinks=False):
+                    model_name = entry.name[:-len('_output.txt')]
+                    futures[model_name] = executor.submit(_process_one, entry.path, output_dir, model_name)
+        
+        # Report in listing order so the combined file stays stable
+        for model_name, future in futures.items():
             print(f"\nProcessing {model_name}...")
+            extracted = future.result()
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract contacts
-            extracted = extract_contacts_from_text(content)
-            
-            if extracted and extracted['contacts']:
+            if extracted:
                 results[model_name] = extracted
-                # Save individual JSON
-                json_path = os.path.join(output_dir, f"{model_name}.json")
-                with open(json_path, 'w') as f:
-                    json.dump(extracted, f, indent=2)
                 print(f"  ✓ Found {len(extracted['contacts'])} contacts")
                 for contact in extracted['contacts']:
                     print(f"    - {contact['name']} ({contact['title']})")
@@ -170,8 +310,8 @@ def process_all_outputs():
     
     # Save combined results
     if results:
-        with open(os.path.join(output_dir, "all_extractions.json"), 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(os.path.join(output_dir, "all_extractions.json"), 'wb', buffering=65536) as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         print(f"\n✅ Successfully extracted data from {len(results)} models")
     
     return results
@@ -4,8 +4,10 @@ Run all model tests and capture outputs
 """
 import subprocess
 import json
+import tempfile
+import threading
 import time
-import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -39,95 +41,138 @@ print(f"🚀 Starting model tests at {datetime.now()}")
 print(f"📁 Output directory: {output_dir}")
 print(f"🔍 Query: {results['query']}\n")
 
-for model_name, script_name in MODELS:
-    print(f"\n{'='*60}")
-    print(f"Testing {model_name} ({script_name})")
-    print(f"{'='*60}")
-    
-    start_time = time.time()
+def find_json_output(text):
+    """Return the lead results JSON object in text, else the largest one, or None."""
+    # Candidates are objects that begin a line. raw_decode parses from the '{'
+    # and reports where the value ends, so lines inside a decoded object are
+    # skipped instead of re-joining and re-parsing them.
+    decoder = json.JSONDecoder()
+    largest = None
+    largest_len = 0
+    offset = end = 0
+    for line in text.splitlines(keepends=True):
+        start = offset + len(line) - len(line.lstrip())
+        offset += len(line)
+        if start < end or not text.startswith('{', start):
+            continue
+        try:
+            obj, end = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(obj, dict):
+            continue
+        if 'business' in obj and 'contacts' in obj:
+            return obj
+        if end - start > largest_len:
+            largest, largest_len = obj, end - start
+    return largest
+
+def run_model_test(model_name, script_name):
+    """Run one model script, save its raw and JSON output, and return its result entry."""
+    start_time = time.monotonic()
     
     try:
-        # Run the script and capture output
-        # Load environment variables for subprocess
-        env = os.environ.copy()
-        result = subprocess.run(
-            ["python3", script_name],
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-            cwd=".",
-            env=env
-        )
+        # Stream stdout straight into the raw output file, keeping only the text
+        # from the first line that starts with '{' for the JSON search. stderr
+        # goes to a temp file so a chatty child can't block on a full pipe.
+        # The subprocess inherits os.environ, including the .env values loaded above
+        output_file = output_dir / f"{model_name}_output.txt"
+        with tempfile.TemporaryFile(mode='w+') as stderr_file, open(output_file, 'w', buffering=65536) as f:
+            proc = subprocess.Popen(
+                ["python3", script_name],
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                bufsize=65536,
+                cwd="."
+            )
+            
+            timed_out = threading.Event()
+            def kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+            timer = threading.Timer(300, kill_on_timeout)  # 5 minute timeout
+            timer.start()
+            
+            json_lines = []
+            try:
+                for line in proc.stdout:
+                    f.write(line)
+                    if json_lines or line.lstrip().startswith('{'):
+                        json_lines.append(line)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(proc.args, 300)
+            
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
         
-        end_time = time.time()
-        duration = end_time - start_time
+        duration = time.monotonic() - start_time
         
         # Extract JSON output from stdout
-        output_lines = result.stdout.strip().split('\n')
-        json_output = None
-        
-        # Look for JSON in the output
-        for i, line in enumerate(output_lines):
-            if line.strip().startswith('{'):
-                # Found potential JSON start
-                json_str = '\n'.join(output_lines[i:])
-                try:
-                    json_output = json.loads(json_str)
-                    break
-                except:
-                    # Try to find valid JSON portion
-                    for j in range(len(output_lines) - 1, i - 1, -1):
-                        if output_lines[j].strip().endswith('}'):
-                            json_str = '\n'.join(output_lines[i:j+1])
-                            try:
-                                json_output = json.loads(json_str)
-                                break
-                            except:
-                                continue
-        
-        # Save raw output
-        output_file = output_dir / f"{model_name}_output.txt"
-        with open(output_file, 'w') as f:
-            f.write(result.stdout)
+        json_output = find_json_output(''.join(json_lines))
         
         # Save JSON output if found
-        if json_output:
+        if json_output is not None:
             json_file = output_dir / f"{model_name}_output.json"
             with open(json_file, 'w') as f:
                 json.dump(json_output, f, indent=2)
-            print(f"✅ JSON output saved to {json_file}")
-        else:
-            print(f"⚠️  No valid JSON found in output")
         
-        # Store results
-        results["models"][model_name] = {
-            "status": "success" if result.returncode == 0 else "error",
+        return {
+            "status": "success" if returncode == 0 else "error",
             "duration_seconds": duration,
             "output_file": str(output_file),
-            "json_file": str(json_file) if json_output else None,
-            "error": result.stderr if result.returncode != 0 else None,
+            "json_file": str(json_file) if json_output is not None else None,
+            "error": stderr if returncode != 0 else None,
             "json_found": json_output is not None
         }
         
-        print(f"✅ Completed in {duration:.2f} seconds")
-        
     except subprocess.TimeoutExpired:
-        results["models"][model_name] = {
+        return {
             "status": "timeout",
             "duration_seconds": 300,
             "error": "Process timed out after 5 minutes"
         }
-        print(f"❌ Timeout after 5 minutes")
         
     except Exception as e:
-        results["models"][model_name] = {
+        return {
             "status": "error",
             "error": str(e)
         }
-        print(f"❌ Error: {e}")
+
+# The model scripts mostly wait on remote APIs, so run them all at once
+model_results = {}
+with ThreadPoolExecutor(max_workers=len(MODELS)) as executor:
+    futures = {
+        executor.submit(run_model_test, model_name, script_name): (model_name, script_name)
+        for model_name, script_name in MODELS
+    }
     
-    # Brief pause between models
-    time.sleep(2)
+    for future in as_completed(futures):
+        model_name, script_name = futures[future]
+        model_result = future.result()
+        model_results[model_name] = model_result
+        
+        print(f"\n{'='*60}")
+        print(f"Tested {model_name} ({script_name})")
+        print(f"{'='*60}")
+        
+        if model_result["status"] == "timeout":
+            print(f"❌ Timeout after 5 minutes")
+        elif "duration_seconds" not in model_result:
+            print(f"❌ Error: {model_result['error']}")
+        else:
+            if model_result["json_found"]:
+                print(f"✅ JSON output saved to {model_result['json_file']}")
+            else:
+                print(f"⚠️  No valid JSON found in output")
+            print(f"✅ Completed in {model_result['duration_seconds']:.2f} seconds")
+
+# Keep the summary in MODELS order regardless of completion order
+results["models"] = {model_name: model_results[model_name] for model_name, _ in MODELS}
 
 # Save results summary
 summary_file = output_dir / "test_summary.json"
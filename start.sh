@@ -19,13 +19,16 @@ echo "✓ OPENROUTER_API_KEY is set"
 echo "✓ EXA_API_KEY is set"
 echo "Starting gunicorn..."
 
-# Start the service with 5 minute timeout
+# Start the service with 5 minute timeout.
+# The agent keeps per-run state, so concurrency comes from worker processes
+# (one request each); gthread with a single thread adds HTTP keep-alive.
 exec gunicorn wsgi:app \
     --bind 0.0.0.0:${PORT:-5001} \
-    --workers 1 \
+    --workers ${WEB_CONCURRENCY:-4} \
     --timeout 300 \
-    --worker-class sync \
+    --worker-class gthread \
     --threads 1 \
+    --keep-alive 30 \
     --preload \
     --access-logfile - \
     --error-logfile - \